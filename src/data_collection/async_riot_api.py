@@ -0,0 +1,285 @@
+"""
+Async Riot Games API Wrapper
+============================
+aiohttp-based variant of the RiotAPI wrapper for fetching many
+matches concurrently within the Riot API rate limits.
+
+Usage:
+    >>> import asyncio
+    >>> from src.data_collection.async_riot_api import AsyncRiotAPI
+    >>> async def main(match_ids):
+    ...     async with AsyncRiotAPI(api_key="YOUR_KEY", region="na1") as api:
+    ...         return await api.get_matches_async(match_ids)
+    >>> matches = asyncio.run(main(["NA1_1234567890", "NA1_1234567891"]))
+"""
+
+import asyncio
+import aiohttp
+from typing import Dict, List, Optional, Any
+import logging
+
+from urllib.parse import quote
+
+from .riot_api import (RateLimiter, RiotAPI, RiotAPIError, _Retry,
+                       _handle_response, _timeout_retry_delay)
+
+logger = logging.getLogger(__name__)
+
+# Timeline payloads for long games run past 500KB; the 64KB aiohttp
+# default makes the event loop decode them in many small reads.
+READ_BUFSIZE = 4 * 1024 * 1024
+
+
+class AsyncRateLimiter(RateLimiter):
+    """
+    Rate limiter for use inside an event loop.
+
+    Same limits as RateLimiter, plus wait_if_needed_async(), which waits
+    with asyncio.sleep so other tasks keep running while a request is held
+    back. The synchronous wait_if_needed() still works and draws on the
+    same limits, so the inherited sync endpoints stay rate limited.
+    """
+
+    __slots__ = ('_async_lock', '_async_lock_loop')
+
+    def __init__(self, requests_per_second: int = 20, requests_per_2min: int = 100):
+        super().__init__(requests_per_second, requests_per_2min)
+
+        # Created lazily, and again for each new event loop, since an
+        # asyncio.Lock can only be used from the loop it first binds to
+        self._async_lock = None
+        self._async_lock_loop = None
+
+    async def wait_if_needed_async(self):
+        """Wait if we're about to exceed rate limits, without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_lock is None or self._async_lock_loop is not loop:
+            self._async_lock = asyncio.Lock()
+            self._async_lock_loop = loop
+
+        async with self._async_lock:
+            sleep_time = self._reserve()
+            while sleep_time > 0:
+                await asyncio.sleep(sleep_time)
+                sleep_time = self._reserve()
+
+
+class AsyncRiotAPI(RiotAPI):
+    """
+    Async wrapper for Riot Games API.
+
+    Inherits the synchronous endpoints from RiotAPI and adds ``*_async``
+    coroutines backed by a single shared aiohttp session. Use it with
+    ``async with`` (or ``await aclose()``); closing the aiohttp session
+    requires the event loop, so plain ``with`` is not supported.
+
+    Usage:
+        >>> async with AsyncRiotAPI(api_key="YOUR_KEY", region="na1") as api:
+        ...     matches = await api.get_matches_async(match_ids)
+    """
+
+    __slots__ = ('max_connections', '_async_session', '_semaphore')
+
+    def __init__(self, api_key: str, region: str = 'na1',
+                 rate_limit: bool = True, max_retries: int = 3,
+                 cache_dir: Optional[str] = None, max_connections: int = 20):
+        """
+        Initialize the async Riot API wrapper.
+
+        Args:
+            api_key: Your Riot API key from developer.riotgames.com
+            region: Server region (na1, euw1, kr, etc.)
+            rate_limit: Whether to enforce rate limiting
+            max_retries: Maximum number of retry attempts for failed requests
+            cache_dir: Directory for the on-disk response cache (None disables caching)
+            max_connections: Maximum number of open connections in the pool
+        """
+        super().__init__(api_key, region=region, rate_limit=rate_limit,
+                         max_retries=max_retries, cache_dir=cache_dir)
+
+        self.rate_limiter = AsyncRateLimiter() if rate_limit else None
+        self.max_connections = max_connections
+
+        # Created lazily inside the running event loop
+        self._async_session = None
+        self._semaphore = None
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use."""
+        if self._async_session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                read_bufsize=READ_BUFSIZE,
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+
+            # Cap in-flight requests at the per-second rate limit
+            in_flight = self.rate_limiter.requests_per_second if self.rate_limiter else self.max_connections
+            self._semaphore = asyncio.Semaphore(in_flight)
+        return self._async_session
+
+    async def aclose(self):
+        """Close the aiohttp session and the inherited requests session."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+            self._semaphore = None
+        if self.rate_limiter is not None:
+            self.rate_limiter._async_lock = None
+            self.rate_limiter._async_lock_loop = None
+        self.close()
+
+    def close(self):
+        """Close the inherited requests session; use aclose() to close everything."""
+        if self._async_session is not None:
+            raise RuntimeError("AsyncRiotAPI has an open aiohttp session; use 'await aclose()'")
+        super().close()
+
+    def __enter__(self):
+        raise TypeError("AsyncRiotAPI must be used with 'async with'")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _make_request_async(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Make a request to the Riot API with retry logic and rate limiting.
+
+        Args:
+            url: Full URL to request
+            params: Optional query parameters
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            RiotAPIError: If request fails after all retries
+        """
+        session = self._get_async_session()
+
+        async with self._semaphore:
+            if self.rate_limiter:
+                await self.rate_limiter.wait_if_needed_async()
+
+            for attempt in range(self.max_retries):
+                try:
+                    async with session.get(url, params=params) as response:
+                        status, headers = response.status, response.headers
+                        body = await response.read()
+                except asyncio.TimeoutError:
+                    await asyncio.sleep(_timeout_retry_delay(self, attempt))
+                    continue
+                except aiohttp.ClientError as e:
+                    raise RiotAPIError(f"Request failed: {str(e)}")
+
+                result = _handle_response(self, url, status, headers, body, attempt)
+                if isinstance(result, _Retry):
+                    await asyncio.sleep(result.delay)
+                    continue
+                return result
+
+            raise RiotAPIError(f"Failed after {self.max_retries} attempts")
+
+    async def _cached_request_async(self, url: str, params: Optional[Dict] = None,
+                                    expire: Optional[float] = None) -> Any:
+        """Async version of _cached_request()."""
+        if self.cache is None:
+            return await self._make_request_async(url, params)
+
+        key = self._cache_key(url, params)
+        result = self.cache.get(key)
+        if result is None:
+            result = await self._make_request_async(url, params)
+            self.cache.set(key, result, expire=expire)
+        return result
+
+    # ==================== SUMMONER ENDPOINTS ====================
+
+    async def get_summoner_by_name_async(self, summoner_name: str) -> Dict[str, Any]:
+        """Async version of get_summoner_by_name()."""
+        url = self._urls['summoner_by_name'].format(summoner_name=quote(summoner_name, safe=''))
+        logger.info("Fetching summoner: %s", summoner_name)
+        return await self._cached_request_async(url, expire=self.CACHE_TTL)
+
+    # ==================== MATCH ENDPOINTS ====================
+
+    async def get_match_ids_async(self, puuid: str, start: int = 0, count: int = 20,
+                                  queue: Optional[int] = None, type: Optional[int] = None) -> List[str]:
+        """Async version of get_match_ids()."""
+        url = self._urls['match_ids'].format(puuid=puuid)
+
+        params = {
+            'start': start,
+            'count': min(count, 100),  # API max is 100
+        }
+
+        if queue:
+            params['queue'] = queue
+        if type is not None:
+            params['type'] = type
+
+        logger.info("Fetching match IDs for PUUID: %.8s... (start=%s, count=%s)", puuid, start, count)
+        result = await self._cached_request_async(url, params, expire=self.CACHE_TTL)
+        if __debug__ and not isinstance(result, list):
+            raise RiotAPIError(f"Expected a list of match IDs, got: {result.__class__.__name__}")
+        return result
+
+    async def get_match_async(self, match_id: str) -> Dict[str, Any]:
+        """Async version of get_match()."""
+        url = self._urls['match'].format(match_id=match_id)
+        logger.info("Fetching match: %s", match_id)
+        return await self._cached_request_async(url)
+
+    async def get_match_timeline_async(self, match_id: str) -> Dict[str, Any]:
+        """Async version of get_match_timeline()."""
+        url = self._urls['timeline'].format(match_id=match_id)
+        return await self._cached_request_async(url)
+
+    # ==================== UTILITY METHODS ====================
+
+    async def get_matches_async(self, match_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch many matches concurrently.
+
+        Matches that fail to download are logged and skipped, the same
+        as in get_player_recent_matches().
+
+        Args:
+            match_ids: Match IDs to fetch
+
+        Returns:
+            List of detailed match data, in the order of match_ids
+        """
+        async def fetch(match_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return await self.get_match_async(match_id)
+            except RiotAPIError as e:
+                logger.error("Failed to fetch match %s: %s", match_id, e)
+                return None
+
+        matches = await asyncio.gather(*[fetch(match_id) for match_id in match_ids])
+        return [match for match in matches if match is not None]
+
+    async def get_player_recent_matches_async(self, summoner_name: str,
+                                              count: int = 20) -> List[Dict[str, Any]]:
+        """
+        Async version of get_player_recent_matches().
+
+        The summoner and match-ID lookups depend on each other and run in
+        turn; the match downloads then all run concurrently.
+
+        Args:
+            summoner_name: Summoner name
+            count: Number of matches to fetch
+
+        Returns:
+            List of detailed match data
+        """
+        summoner = await self.get_summoner_by_name_async(summoner_name)
+        match_ids = await self.get_match_ids_async(summoner['puuid'], count=count)
+        return await self.get_matches_async(match_ids)
@@ -9,9 +9,17 @@ Date: January 2026
 """
 
 import time
+import types
+import hashlib
+import threading
+from collections import OrderedDict, deque
+import orjson
 import requests
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import diskcache
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Any
+from urllib.parse import quote, urlencode
 import logging
 
 # Set up logging
@@ -21,50 +29,95 @@ logger = logging.getLogger(__name__)
 
 class RateLimiter:
     """
-    Simple rate limiter to respect Riot API limits.
+    Sliding-window rate limiter to respect Riot API limits.
     
     Riot Development API Limits:
     - 20 requests per second
     - 100 requests per 2 minutes
+    
+    Send times are kept per window in a deque; a request is admitted only
+    while fewer than the limit were sent in the trailing window.
     """
     
+    __slots__ = (
+        'requests_per_second', 'requests_per_2min',
+        'second_requests', 'two_min_requests',
+        '_lock', '_cv',
+    )
+    
     def __init__(self, requests_per_second: int = 20, requests_per_2min: int = 100):
         self.requests_per_second = requests_per_second
         self.requests_per_2min = requests_per_2min
         
-        # Track request timestamps
-        self.second_requests = []
-        self.two_min_requests = []
+        # Track request timestamps (time.monotonic() seconds), oldest first
+        self.second_requests = deque(maxlen=requests_per_second)
+        self.two_min_requests = deque(maxlen=requests_per_2min)
+        
+        # Shared across worker threads and event-loop tasks. Re-entrant so
+        # _delay()/_record() can take it while wait_if_needed() holds the
+        # condition; waiting on the condition releases it for other workers.
+        # Nothing calls notify: a slot frees up only when a timestamp ages
+        # out of its window, not when a request finishes, so each waiter
+        # just waits out the delay _delay() computed and checks again.
+        self._lock = threading.RLock()
+        self._cv = threading.Condition(self._lock)
+    
+    def _delay(self) -> float:
+        """Return how many seconds to wait before the next request is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            
+            # Drop timestamps that have left each window
+            cutoff_1sec = now - 1.0
+            while self.second_requests and self.second_requests[0] <= cutoff_1sec:
+                self.second_requests.popleft()
+            
+            cutoff_2min = now - 120.0
+            while self.two_min_requests and self.two_min_requests[0] <= cutoff_2min:
+                self.two_min_requests.popleft()
+            
+            delay = 0.0
+            
+            if len(self.second_requests) >= self.requests_per_second:
+                sleep_time = self.second_requests[0] - cutoff_1sec
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Rate limit: sleeping %.2fs", sleep_time)
+                delay = max(delay, sleep_time)
+            
+            if len(self.two_min_requests) >= self.requests_per_2min:
+                sleep_time = self.two_min_requests[0] - cutoff_2min
+                logger.warning("2-minute rate limit: sleeping %.2fs", sleep_time)
+                delay = max(delay, sleep_time)
+            
+            return delay
+    
+    def _record(self):
+        """Record that a request is being sent now."""
+        with self._lock:
+            now = time.monotonic()
+            self.second_requests.append(now)
+            self.two_min_requests.append(now)
+    
+    def _reserve(self) -> float:
+        """
+        Record a request if one is allowed now.
         
+        Returns:
+            0 if the request was recorded, else seconds to wait before retrying
+        """
+        with self._lock:
+            delay = self._delay()
+            if delay <= 0:
+                self._record()
+            return delay
+    
     def wait_if_needed(self):
         """Wait if we're about to exceed rate limits."""
-        now = datetime.now()
-        
-        # Clean old timestamps (older than 2 minutes)
-        cutoff_2min = now - timedelta(minutes=2)
-        self.two_min_requests = [ts for ts in self.two_min_requests if ts > cutoff_2min]
-        
-        # Clean old timestamps (older than 1 second)
-        cutoff_1sec = now - timedelta(seconds=1)
-        self.second_requests = [ts for ts in self.second_requests if ts > cutoff_1sec]
-        
-        # Check if we need to wait
-        if len(self.second_requests) >= self.requests_per_second:
-            sleep_time = 1.0 - (now - self.second_requests[0]).total_seconds()
-            if sleep_time > 0:
-                logger.debug(f"Rate limit: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-        
-        if len(self.two_min_requests) >= self.requests_per_2min:
-            sleep_time = 120 - (now - self.two_min_requests[0]).total_seconds()
-            if sleep_time > 0:
-                logger.warning(f"2-minute rate limit: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-        
-        # Record this request
-        now = datetime.now()
-        self.second_requests.append(now)
-        self.two_min_requests.append(now)
+        with self._cv:
+            sleep_time = self._reserve()
+            while sleep_time > 0:
+                self._cv.wait(timeout=sleep_time)
+                sleep_time = self._reserve()
 
 
 class RiotAPIError(Exception):
@@ -72,6 +125,109 @@ class RiotAPIError(Exception):
     pass
 
 
+# ==================== RESPONSE HANDLING ====================
+# Shared by RiotAPI and AsyncRiotAPI. Handlers only see the status code,
+# headers and raw body, so they work for requests and aiohttp responses
+# alike; the caller does the actual (blocking or async) sleep on retry.
+
+class _Retry:
+    """Returned by a status handler when the request should be retried."""
+    
+    __slots__ = ('delay',)
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+
+
+# Seconds to back off before each retry (the last value is reused)
+_BACKOFF = (1, 2, 4, 8)
+
+
+def _backoff(attempt: int) -> int:
+    """Return the back-off delay for a zero-based retry attempt."""
+    return _BACKOFF[min(attempt, len(_BACKOFF) - 1)]
+
+
+def _handle_ok(api: 'RiotAPI', url: str, status: int, headers: Mapping[str, str],
+               body: bytes, attempt: int) -> Any:
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise RiotAPIError(f"Invalid JSON response from {url}: {e}")
+
+
+def _handle_not_found(api: 'RiotAPI', url: str, status: int, headers: Mapping[str, str],
+                      body: bytes, attempt: int) -> Any:
+    raise RiotAPIError(f"Resource not found: {url}")
+
+
+def _handle_forbidden(api: 'RiotAPI', url: str, status: int, headers: Mapping[str, str],
+                      body: bytes, attempt: int) -> Any:
+    text = body.decode('utf-8', errors='replace')
+    logger.error(
+        "API request failed: Invalid API key or forbidden access",
+        extra={
+            'url': url,
+            'api_key': api.api_key[:10],
+            'status_code': status,
+            'response': text
+        }
+    )
+    raise RiotAPIError(f"Invalid API key or forbidden access. Response: {text}")
+
+
+def _handle_rate_limited(api: 'RiotAPI', url: str, status: int, headers: Mapping[str, str],
+                         body: bytes, attempt: int) -> Any:
+    # Rate limited - wait and retry
+    retry_after = int(headers.get('Retry-After', 5))
+    logger.warning("Rate limited. Waiting %ss...", retry_after)
+    return _Retry(retry_after)
+
+
+def _handle_other(api: 'RiotAPI', url: str, status: int, headers: Mapping[str, str],
+                  body: bytes, attempt: int) -> Any:
+    if status >= 500:
+        # Server error - retry with exponential backoff
+        logger.warning("Server error %s. Attempt %d/%d", status, attempt + 1, api.max_retries)
+        return _Retry(_backoff(attempt))
+    text = body.decode('utf-8', errors='replace')
+    raise RiotAPIError(f"Unexpected status code {status}: {text}")
+
+
+# Status code -> handler; anything else goes to _handle_other
+_STATUS_HANDLERS: Dict[int, Callable[..., Any]] = {
+    200: _handle_ok,
+    403: _handle_forbidden,
+    404: _handle_not_found,
+    429: _handle_rate_limited,
+}
+
+
+def _handle_response(api: 'RiotAPI', url: str, status: int, headers: Mapping[str, str],
+                     body: bytes, attempt: int) -> Any:
+    """
+    Map a response to its decoded payload, a _Retry, or a RiotAPIError.
+    
+    Args:
+        api: Client that made the request
+        url: Requested URL (without query parameters), for error messages
+        status: HTTP status code
+        headers: Response headers (case-insensitive mapping)
+        body: Raw response body
+        attempt: Zero-based attempt number
+    """
+    handler = _STATUS_HANDLERS.get(status, _handle_other)
+    return handler(api, url, status, headers, body, attempt)
+
+
+def _timeout_retry_delay(api: 'RiotAPI', attempt: int) -> int:
+    """Return the back-off before retrying a timed-out request, or raise on the last attempt."""
+    logger.warning("Request timeout. Attempt %d/%d", attempt + 1, api.max_retries)
+    if attempt < api.max_retries - 1:
+        return _backoff(attempt)
+    raise RiotAPIError("Request timed out after all retries")
+
+
 class RiotAPI:
     """
     Wrapper for Riot Games API.
@@ -88,10 +244,19 @@ class RiotAPI:
         >>> api = RiotAPI(api_key="YOUR_KEY", region="na1")
         >>> summoner = api.get_summoner_by_name("Doublelift")
         >>> print(summoner['name'], summoner['summonerLevel'])
+    
+    Connections are pooled in a ``requests.Session``; use the instance as a
+    context manager (or call ``close()``) to release them when done.
     """
     
+    __slots__ = (
+        'api_key', 'region', 'max_retries', 'platform_url', 'regional_url',
+        '_urls', 'rate_limiter', 'headers', 'session', 'cache',
+        '_summoner_cache', '_league_cache', '_memo_lock', '_memo_pending',
+    )
+    
     # Base URLs for different API endpoints
-    PLATFORM_URLS = {
+    PLATFORM_URLS = types.MappingProxyType({
         'na1': 'https://na1.api.riotgames.com',
         'euw1': 'https://euw1.api.riotgames.com',
         'kr': 'https://kr.api.riotgames.com',
@@ -103,23 +268,39 @@ class RiotAPI:
         'oc1': 'https://oc1.api.riotgames.com',
         'tr1': 'https://tr1.api.riotgames.com',
         'ru': 'https://ru.api.riotgames.com',
-    }
+    })
     
-    REGIONAL_URLS = {
+    REGIONAL_URLS = types.MappingProxyType({
         'americas': 'https://americas.api.riotgames.com',
         'europe': 'https://europe.api.riotgames.com',
         'asia': 'https://asia.api.riotgames.com',
-    }
+    })
     
     # Map platform to regional routing
-    PLATFORM_TO_REGION = {
+    PLATFORM_TO_REGION = types.MappingProxyType({
         'na1': 'americas', 'br1': 'americas', 'la1': 'americas', 'la2': 'americas',
         'euw1': 'europe', 'eun1': 'europe', 'tr1': 'europe', 'ru': 'europe',
         'kr': 'asia', 'jp1': 'asia', 'oc1': 'asia',
-    }
+    })
+    
+    _VALID_REGIONS = frozenset(PLATFORM_URLS)
+    
+    # Seconds before cached summoner/ranked/match-list responses go stale.
+    # Finished matches and timelines never change and are cached forever.
+    CACHE_TTL = 300
+    
+    # Seconds to keep the Challenger league in the in-memory memo
+    LEAGUE_CACHE_TTL = 3600
+    
+    # Entries kept in each in-memory memo before the least recently used is evicted
+    MEMO_MAXSIZE = 4096
+    
+    # Worker threads for bulk fetches when rate limiting is disabled
+    MAX_WORKERS = 20
     
     def __init__(self, api_key: str, region: str = 'na1', 
-                 rate_limit: bool = True, max_retries: int = 3):
+                 rate_limit: bool = True, max_retries: int = 3,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the Riot API wrapper.
         
@@ -128,19 +309,32 @@ class RiotAPI:
             region: Server region (na1, euw1, kr, etc.)
             rate_limit: Whether to enforce rate limiting
             max_retries: Maximum number of retry attempts for failed requests
+            cache_dir: Directory for the on-disk response cache (None disables caching)
         """
         self.api_key = api_key
         self.region = region.lower()
         self.max_retries = max_retries
         
         # Validate region
-        if self.region not in self.PLATFORM_URLS:
-            raise ValueError(f"Invalid region: {region}. Must be one of {list(self.PLATFORM_URLS.keys())}")
+        if self.region not in self._VALID_REGIONS:
+            raise ValueError(f"Invalid region: {region}. Must be one of {list(self.PLATFORM_URLS)}")
         
         # Set base URLs
         self.platform_url = self.PLATFORM_URLS[self.region]
         self.regional_url = self.REGIONAL_URLS[self.PLATFORM_TO_REGION[self.region]]
         
+        # Endpoint URL templates, filled in with str.format()
+        self._urls = {
+            'account_by_riot_id': self.regional_url + '/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}',
+            'summoner_by_name': self.platform_url + '/lol/summoner/v4/summoners/by-name/{summoner_name}',
+            'summoner_by_puuid': self.platform_url + '/lol/summoner/v4/summoners/by-puuid/{puuid}',
+            'match_ids': self.regional_url + '/lol/match/v5/matches/by-puuid/{puuid}/ids',
+            'match': self.regional_url + '/lol/match/v5/matches/{match_id}',
+            'timeline': self.regional_url + '/lol/match/v5/matches/{match_id}/timeline',
+            'ranked_entries': self.platform_url + '/lol/league/v4/entries/by-summoner/{summoner_id}',
+            'challenger_league': self.platform_url + '/lol/league/v4/challengerleagues/by-queue/{queue}',
+        }
+        
         # Set up rate limiter
         self.rate_limiter = RateLimiter() if rate_limit else None
         
@@ -150,7 +344,35 @@ class RiotAPI:
             'Accept': 'application/json',
         }
         
-        logger.info(f"RiotAPI initialized for region: {self.region}")
+        # Pooled session: reuses TCP/TLS connections to the platform and regional hosts
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        self.session.mount('https://', adapter)
+        
+        # Optional on-disk response cache
+        self.cache = diskcache.Cache(str(cache_dir)) if cache_dir else None
+        
+        # In-memory LRU memos for lookups repeated while walking a league: key -> (timestamp, data)
+        self._summoner_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._league_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._memo_lock = threading.Lock()
+        # (memo id, key) -> Future for lookups currently being fetched
+        self._memo_pending: Dict[Tuple[int, str], Future] = {}
+        
+        logger.info("RiotAPI initialized for region: %s", self.region)
+    
+    def close(self):
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -171,55 +393,118 @@ class RiotAPI:
         
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(url, headers=self.headers, params=params, timeout=10)
-                
-                # Handle different status codes
-                if response.status_code == 200:
-                    return response.json()
-                
-                elif response.status_code == 404:
-                    raise RiotAPIError(f"Resource not found: {url}")
-                
-                elif response.status_code == 403:
-                    logger.error(
-                        "API request failed: Invalid API key or forbidden access",
-                        extra={
-                            'url': url,
-                            'api_key': self.api_key[:10],
-                            'status_code': response.status_code,
-                            'response': response.text
-                        }
-                    )
-                    raise RiotAPIError(f"Invalid API key or forbidden access. Response: {response.text}")
-                
-                elif response.status_code == 429:
-                    # Rate limited - wait and retry
-                    retry_after = int(response.headers.get('Retry-After', 5))
-                    logger.warning(f"Rate limited. Waiting {retry_after}s...")
-                    time.sleep(retry_after)
-                    continue
-                
-                elif response.status_code >= 500:
-                    # Server error - retry
-                    logger.warning(f"Server error {response.status_code}. Attempt {attempt + 1}/{self.max_retries}")
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                    continue
-                
-                else:
-                    raise RiotAPIError(f"Unexpected status code {response.status_code}: {response.text}")
-            
+                response = self.session.get(url, params=params, timeout=10)
             except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout. Attempt {attempt + 1}/{self.max_retries}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                raise RiotAPIError("Request timed out after all retries")
-            
+                time.sleep(_timeout_retry_delay(self, attempt))
+                continue
             except requests.exceptions.RequestException as e:
                 raise RiotAPIError(f"Request failed: {str(e)}")
+            
+            result = _handle_response(self, url, response.status_code, response.headers,
+                                      response.content, attempt)
+            if isinstance(result, _Retry):
+                time.sleep(result.delay)
+                continue
+            return result
         
         raise RiotAPIError(f"Failed after {self.max_retries} attempts")
     
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict] = None) -> str:
+        """Build the response cache key for a URL and its query parameters."""
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        return hashlib.blake2b(url.encode()).hexdigest()
+    
+    def _cached_request(self, url: str, params: Optional[Dict] = None,
+                        expire: Optional[float] = None) -> Any:
+        """
+        Make a request through the on-disk response cache.
+        
+        Args:
+            url: Full URL to request
+            params: Optional query parameters
+            expire: Seconds until the cached response goes stale (None = never)
+            
+        Returns:
+            JSON response, from the cache if present
+        """
+        if self.cache is None:
+            return self._make_request(url, params)
+        
+        key = self._cache_key(url, params)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._make_request(url, params)
+            self.cache.set(key, result, expire=expire)
+        return result
+    
+    def _memoized(self, memo: 'OrderedDict[str, Tuple[float, Any]]', key: str, ttl: float,
+                  fetch: Callable[[], Any]) -> Any:
+        """
+        Return memo[key] if younger than ttl seconds, else fetch and store it.
+        
+        The memo is kept in least-recently-used order and trimmed to
+        MEMO_MAXSIZE entries, so long multi-league runs stay bounded.
+        Concurrent lookups of the same key share a single fetch.
+        """
+        now = time.monotonic()
+        pending_key = (id(memo), key)
+        with self._memo_lock:
+            entry = memo.get(key)
+            if entry is not None and now - entry[0] < ttl:
+                memo.move_to_end(key)
+                return entry[1]
+            
+            # Another thread is already fetching this key: wait for its result
+            pending = self._memo_pending.get(pending_key)
+            if pending is None:
+                self._memo_pending[pending_key] = Future()
+        if pending is not None:
+            return pending.result()
+        
+        # Fetch outside the lock so worker threads can look up other keys meanwhile
+        try:
+            data = fetch()
+        except BaseException as e:
+            with self._memo_lock:
+                self._memo_pending.pop(pending_key).set_exception(e)
+            raise
+        
+        with self._memo_lock:
+            memo[key] = (now, data)
+            memo.move_to_end(key)
+            while len(memo) > self.MEMO_MAXSIZE:
+                memo.popitem(last=False)
+            self._memo_pending.pop(pending_key).set_result(data)
+        return data
+    
+    def _fetch_many(self, fetch: Callable[[str], Any], keys: List[str], label: str) -> List[Any]:
+        """
+        Call fetch(key) for every key on a thread pool paced by the rate limiter.
+        
+        Args:
+            fetch: Endpoint method taking a single key
+            keys: Keys to fetch
+            label: What is being fetched, for log messages
+            
+        Returns:
+            Results in the order of keys, skipping keys that raised RiotAPIError
+        """
+        max_workers = self.rate_limiter.requests_per_second if self.rate_limiter else self.MAX_WORKERS
+        results = [None] * len(keys)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetch, key) for key in keys]
+            for i, future in enumerate(futures):
+                try:
+                    results[i] = future.result()
+                    logger.info("Fetched %s %d/%d", label, i + 1, len(keys))
+                except RiotAPIError as e:
+                    logger.error("Failed to fetch %s %s: %s", label, keys[i], e)
+                    continue
+        
+        return [result for result in results if result is not None]
+    
     # ==================== SUMMONER ENDPOINTS ====================
     
     def get_account_by_riot_id(self, game_name: str, tag_line: str) -> Dict[str, Any]:
@@ -234,11 +519,10 @@ class RiotAPI:
         Returns:
             Dictionary with account info including puuid
         """
-        import urllib.parse
-        game_name_encoded = urllib.parse.quote(game_name)
-        tag_line_encoded = urllib.parse.quote(tag_line)
-        url = f"{self.regional_url}/riot/account/v1/accounts/by-riot-id/{game_name_encoded}/{tag_line_encoded}"
-        logger.info(f"Fetching account: {game_name}#{tag_line}")
+        url = self._urls['account_by_riot_id'].format(
+            game_name=quote(game_name, safe=''), tag_line=quote(tag_line, safe=''))
+        logger.info("Fetching account: %s#%s", game_name, tag_line)
+        # Not cached: test_connection() relies on this call reaching the API
         return self._make_request(url)
     
     def get_summoner_by_name(self, summoner_name: str) -> Dict[str, Any]:
@@ -254,16 +538,15 @@ class RiotAPI:
         Returns:
             Dictionary with summoner info (id, accountId, puuid, name, summonerLevel, etc.)
         """
-        import urllib.parse
-        summoner_name_encoded = urllib.parse.quote(summoner_name)
-        url = f"{self.platform_url}/lol/summoner/v4/summoners/by-name/{summoner_name_encoded}"
-        logger.info(f"Fetching summoner: {summoner_name}")
-        return self._make_request(url)
+        url = self._urls['summoner_by_name'].format(summoner_name=quote(summoner_name, safe=''))
+        logger.info("Fetching summoner: %s", summoner_name)
+        return self._cached_request(url, expire=self.CACHE_TTL)
     
     def get_summoner_by_puuid(self, puuid: str) -> Dict[str, Any]:
         """Get summoner information by PUUID."""
-        url = f"{self.platform_url}/lol/summoner/v4/summoners/by-puuid/{puuid}"
-        return self._make_request(url)
+        url = self._urls['summoner_by_puuid'].format(puuid=puuid)
+        return self._memoized(self._summoner_cache, puuid, self.CACHE_TTL,
+                              lambda: self._cached_request(url, expire=self.CACHE_TTL))
     
     # ==================== MATCH ENDPOINTS ====================
     
@@ -282,7 +565,7 @@ class RiotAPI:
         Returns:
             List of match IDs
         """
-        url = f"{self.regional_url}/lol/match/v5/matches/by-puuid/{puuid}/ids"
+        url = self._urls['match_ids'].format(puuid=puuid)
         
         params = {
             'start': start,
@@ -294,10 +577,10 @@ class RiotAPI:
         if type is not None:
             params['type'] = type
         
-        logger.info(f"Fetching match IDs for PUUID: {puuid[:8]}... (start={start}, count={count})")
-        result = self._make_request(url, params)
-        if not isinstance(result, list):
-            raise RiotAPIError(f"Expected a list of match IDs, got: {__builtins__.type(result)}")
+        logger.info("Fetching match IDs for PUUID: %.8s... (start=%s, count=%s)", puuid, start, count)
+        result = self._cached_request(url, params, expire=self.CACHE_TTL)
+        if __debug__ and not isinstance(result, list):
+            raise RiotAPIError(f"Expected a list of match IDs, got: {result.__class__.__name__}")
         return result
     
     def get_match(self, match_id: str) -> Dict[str, Any]:
@@ -310,9 +593,9 @@ class RiotAPI:
         Returns:
             Detailed match data including timeline, participants, and stats
         """
-        url = f"{self.regional_url}/lol/match/v5/matches/{match_id}"
-        logger.info(f"Fetching match: {match_id}")
-        return self._make_request(url)
+        url = self._urls['match'].format(match_id=match_id)
+        logger.info("Fetching match: %s", match_id)
+        return self._cached_request(url)
     
     def get_match_timeline(self, match_id: str) -> Dict[str, Any]:
         """
@@ -324,8 +607,8 @@ class RiotAPI:
         Returns:
             Timeline data with frame-by-frame events
         """
-        url = f"{self.regional_url}/lol/match/v5/matches/{match_id}/timeline"
-        return self._make_request(url)
+        url = self._urls['timeline'].format(match_id=match_id)
+        return self._cached_request(url)
     
     # ==================== RANKED ENDPOINTS ====================
     
@@ -339,17 +622,8 @@ class RiotAPI:
         Returns:
             List of ranked entries (one per queue type)
         """
-        url = f"{self.platform_url}/lol/league/v4/entries/by-summoner/{summoner_id}"
-        result = self._make_request(url)
-        if isinstance(result, list):
-            return result
-        elif isinstance(result, dict):
-            # If the API returns a dict (e.g., error), return an empty list or handle as needed
-            logger.warning(f"Expected a list for ranked entries, got dict: {result}")
-            return []
-        else:
-            logger.warning(f"Unexpected response type for ranked entries: {type(result)}")
-            return []
+        url = self._urls['ranked_entries'].format(summoner_id=summoner_id)
+        return self._cached_request(url, expire=self.CACHE_TTL)
     
     def get_challenger_league(self, queue: str = 'RANKED_SOLO_5x5') -> Dict[str, Any]:
         """
@@ -361,8 +635,9 @@ class RiotAPI:
         Returns:
             Challenger league data
         """
-        url = f"{self.platform_url}/lol/league/v4/challengerleagues/by-queue/{queue}"
-        return self._make_request(url)
+        url = self._urls['challenger_league'].format(queue=queue)
+        return self._memoized(self._league_cache, queue, self.LEAGUE_CACHE_TTL,
+                              lambda: self._cached_request(url, expire=self.CACHE_TTL))
     
     # ==================== UTILITY METHODS ====================
     
@@ -384,18 +659,23 @@ class RiotAPI:
         # Get match IDs
         match_ids = self.get_match_ids(puuid, count=count)
         
-        # Get match details
-        matches = []
-        for i, match_id in enumerate(match_ids, 1):
-            logger.info(f"Fetching match {i}/{len(match_ids)}")
-            try:
-                match_data = self.get_match(match_id)
-                matches.append(match_data)
-            except RiotAPIError as e:
-                logger.error(f"Failed to fetch match {match_id}: {e}")
-                continue
+        # Get match details concurrently
+        return self._fetch_many(self.get_match, match_ids, 'match')
+    
+    def get_summoners_by_puuids(self, puuids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get summoner information for many PUUIDs at once.
         
-        return matches
+        Lookups run concurrently over the pooled session; PUUIDs that
+        fail are logged and skipped.
+        
+        Args:
+            puuids: Player UUIDs, e.g. from a league's entries
+            
+        Returns:
+            List of summoner info, in the order of puuids
+        """
+        return self._fetch_many(self.get_summoner_by_puuid, puuids, 'summoner')
     
     def test_connection(self) -> bool:
         """
@@ -410,7 +690,7 @@ class RiotAPI:
             logger.info("✅ API connection test successful")
             return True
         except RiotAPIError as e:
-            logger.error(f"❌ API connection test failed: {e}")
+            logger.error("❌ API connection test failed: %s", e)
             return False
 
 
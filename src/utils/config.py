@@ -17,6 +17,25 @@ from pathlib import Path
 # This will look for .env in the current directory and parent directories
 load_dotenv()
 
+# Valid platform routing values for RIOT_REGION
+VALID_REGIONS = frozenset(('na1', 'euw1', 'eun1', 'kr', 'br1', 'jp1', 'la1', 'la2', 'oc1', 'tr1', 'ru'))
+
+# Ranked tiers, lowest to highest
+RANK_TIERS = ('IRON', 'BRONZE', 'SILVER', 'GOLD', 'PLATINUM',
+              'DIAMOND', 'MASTER', 'GRANDMASTER', 'CHALLENGER')
+
+# (attribute, predicate, error message) rules checked by Config.validate()
+_CHECKS = (
+    ('RIOT_API_KEY', bool,
+     "RIOT_API_KEY is not set in .env file"),
+    ('RIOT_API_KEY', lambda v: v != 'your_riot_api_key_here',
+     "RIOT_API_KEY still has placeholder value. Please update .env"),
+    ('RIOT_REGION', lambda v: v in VALID_REGIONS,
+     f"RIOT_REGION must be one of {sorted(VALID_REGIONS)}"),
+    ('TARGET_RANK', lambda v: v in RANK_TIERS,
+     f"TARGET_RANK must be one of {list(RANK_TIERS)}"),
+)
+
 
 class Config:
     """
@@ -36,9 +55,8 @@ class Config:
     MATCHES_PER_PLAYER = int(os.getenv('MATCHES_PER_PLAYER', 20))
     TARGET_RANK = os.getenv('TARGET_RANK', 'DIAMOND')
     
-    # Valid ranks: IRON, BRONZE, SILVER, GOLD, PLATINUM, DIAMOND, MASTER, GRANDMASTER, CHALLENGER
-    VALID_RANKS = ['IRON', 'BRONZE', 'SILVER', 'GOLD', 'PLATINUM', 
-                   'DIAMOND', 'MASTER', 'GRANDMASTER', 'CHALLENGER']
+    # Valid values for TARGET_RANK (see RANK_TIERS)
+    VALID_RANKS = RANK_TIERS
     
     # ==================== RATE LIMITING ====================
     REQUESTS_PER_SECOND = int(os.getenv('REQUESTS_PER_SECOND', 20))
@@ -65,6 +83,7 @@ class Config:
     RAW_DATA_DIR = DATA_DIR / 'raw'
     PROCESSED_DATA_DIR = DATA_DIR / 'processed'
     MODELS_DIR = DATA_DIR / 'models'
+    HTTP_CACHE_DIR = RAW_DATA_DIR / 'http_cache'
     
     @classmethod
     def validate(cls) -> bool:
@@ -74,22 +93,7 @@ class Config:
         Returns:
             True if all required config is valid, False otherwise
         """
-        errors = []
-        
-        # Check API key
-        if not cls.RIOT_API_KEY:
-            errors.append("RIOT_API_KEY is not set in .env file")
-        elif cls.RIOT_API_KEY == 'your_riot_api_key_here':
-            errors.append("RIOT_API_KEY still has placeholder value. Please update .env")
-        
-        # Check region
-        valid_regions = ['na1', 'euw1', 'eun1', 'kr', 'br1', 'jp1', 'la1', 'la2', 'oc1', 'tr1', 'ru']
-        if cls.RIOT_REGION not in valid_regions:
-            errors.append(f"RIOT_REGION must be one of {valid_regions}")
-        
-        # Check target rank
-        if cls.TARGET_RANK not in cls.VALID_RANKS:
-            errors.append(f"TARGET_RANK must be one of {cls.VALID_RANKS}")
+        errors = [msg for attr, check, msg in _CHECKS if not check(getattr(cls, attr))]
         
         if errors:
             print("❌ Configuration errors:")
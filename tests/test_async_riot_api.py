@@ -0,0 +1,38 @@
+"""
+AsyncRiotAPI Tests
+==================
+Runs AsyncRiotAPI against a local aiohttp server, so no API key or
+network access is needed.
+
+Usage:
+    python -m pytest tests/test_async_riot_api.py
+"""
+
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.data_collection.async_riot_api import AsyncRiotAPI
+
+
+async def fetch_matches(api: AsyncRiotAPI, match_ids):
+    async def get_match(request):
+        return web.json_response({'metadata': {'matchId': request.match_info['match_id']}})
+
+    app = web.Application()
+    app.router.add_get('/matches/{match_id}', get_match)
+    async with TestServer(app) as server:
+        api._urls['match'] = str(server.make_url('/matches/')) + '{match_id}'
+        async with api:
+            return await api.get_matches_async(match_ids)
+
+
+def test_client_can_be_reused_across_event_loops():
+    api = AsyncRiotAPI(api_key='RGAPI-test', region='na1')
+    match_ids = [f'NA1_{i}' for i in range(25)]
+
+    # Two separate asyncio.run() calls, as a script looping over leagues would make
+    for _ in range(2):
+        matches = asyncio.run(fetch_matches(api, match_ids))
+        assert [m['metadata']['matchId'] for m in matches] == match_ids
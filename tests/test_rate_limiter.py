@@ -0,0 +1,111 @@
+"""
+Rate Limiter Tests
+==================
+Drives RateLimiter.wait_if_needed() with a fake monotonic clock and
+checks that no trailing window admits more requests than Riot allows.
+
+Usage:
+    python -m pytest tests/test_rate_limiter.py
+"""
+
+import bisect
+import types
+
+import pytest
+
+from src.data_collection import riot_api
+from src.data_collection.riot_api import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        # Like a real clock, always move forward a little
+        self.now += max(seconds, 1e-6)
+
+
+class FakeCondition:
+    """Stands in for the limiter's Condition; waiting advances the fake clock."""
+
+    # Bound on waits per test so a broken limiter fails instead of spinning
+    MAX_WAITS = 100000
+
+    def __init__(self, clock: FakeClock):
+        self.clock = clock
+        self.waits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def wait(self, timeout: float):
+        self.waits += 1
+        assert self.waits < self.MAX_WAITS, "limiter kept asking to wait"
+        self.clock.sleep(timeout)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(riot_api, 'time', types.SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    return clock
+
+
+def make_limiter(clock: FakeClock) -> RateLimiter:
+    limiter = RateLimiter(requests_per_second=20, requests_per_2min=100)
+    limiter._cv = FakeCondition(clock)
+    return limiter
+
+
+def max_in_window(stamps, window: float) -> int:
+    """Largest number of stamps falling in any half-open window [t, t + window)."""
+    return max(bisect.bisect_left(stamps, t + window) - i for i, t in enumerate(stamps))
+
+
+@pytest.mark.parametrize('gap', [0.0, 0.01, 0.05, 0.5])
+def test_windows_never_exceed_limits(clock, gap):
+    limiter = make_limiter(clock)
+
+    stamps = []
+    for _ in range(350):
+        limiter.wait_if_needed()
+        stamps.append(clock.now)
+        clock.sleep(gap)
+
+    assert max_in_window(stamps, 1.0) <= 20
+    assert max_in_window(stamps, 120.0) <= 100
+
+
+def test_idle_limiter_does_not_allow_double_burst(clock):
+    limiter = make_limiter(clock)
+
+    # Long idle period, then a burst: only one window's worth goes out at once
+    clock.sleep(600)
+    start = clock.now
+    stamps = []
+    for _ in range(40):
+        limiter.wait_if_needed()
+        stamps.append(clock.now)
+
+    assert sum(1 for ts in stamps if ts < start + 1.0) == 20
+    assert max_in_window(stamps, 1.0) <= 20
+
+
+def test_requests_resume_once_window_expires(clock):
+    limiter = make_limiter(clock)
+
+    for _ in range(20):
+        limiter.wait_if_needed()
+    assert limiter._delay() == pytest.approx(1.0)
+
+    clock.sleep(1.0)
+    assert limiter._delay() == 0.0
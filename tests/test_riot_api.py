@@ -0,0 +1,165 @@
+"""
+RiotAPI Tests
+=============
+Exercises the RiotAPI wrapper against a stubbed ``requests.Session.get``,
+so no API key or network access is needed.
+
+Usage:
+    python -m pytest tests/test_riot_api.py
+"""
+
+import time
+from unittest import mock
+
+import orjson
+import pytest
+import requests
+
+from src.data_collection.riot_api import RiotAPI, RiotAPIError
+
+
+def make_response(status_code: int, payload=None, body: bytes = None, headers=None) -> requests.Response:
+    """Build a requests.Response without touching the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body if body is not None else orjson.dumps(payload)
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def cached_api(tmp_path):
+    api = RiotAPI(api_key='RGAPI-test', region='na1', rate_limit=False, cache_dir=tmp_path / 'http_cache')
+    yield api
+    api.close()
+
+
+# ==================== RESPONSE CACHE ====================
+
+def test_match_data_is_cached_without_expiry(cached_api):
+    with mock.patch.object(cached_api.session, 'get', return_value=make_response(200, {'metadata': {}})) as get:
+        cached_api.get_match('NA1_1')
+        cached_api.get_match('NA1_1')
+        cached_api.get_match_timeline('NA1_1')
+
+    assert get.call_count == 2
+    for url in (cached_api._urls['match'].format(match_id='NA1_1'),
+                cached_api._urls['timeline'].format(match_id='NA1_1')):
+        _, expire_time = cached_api.cache.get(cached_api._cache_key(url), expire_time=True)
+        assert expire_time is None
+
+
+def test_mutable_data_is_cached_with_ttl(cached_api):
+    with mock.patch.object(cached_api.session, 'get', return_value=make_response(200, {'puuid': 'p'})):
+        cached_api.get_summoner_by_puuid('p')
+        cached_api.get_ranked_entries('s')
+    with mock.patch.object(cached_api.session, 'get', return_value=make_response(200, ['NA1_1'])):
+        cached_api.get_match_ids('p', count=5)
+
+    keys = [
+        cached_api._cache_key(cached_api._urls['summoner_by_puuid'].format(puuid='p')),
+        cached_api._cache_key(cached_api._urls['ranked_entries'].format(summoner_id='s')),
+        cached_api._cache_key(cached_api._urls['match_ids'].format(puuid='p'), {'start': 0, 'count': 5}),
+    ]
+    for key in keys:
+        value, expire_time = cached_api.cache.get(key, expire_time=True)
+        assert value is not None
+        assert expire_time is not None
+
+
+def test_cache_key_includes_query_params():
+    url = 'https://americas.api.riotgames.com/lol/match/v5/matches/by-puuid/p/ids'
+
+    assert RiotAPI._cache_key(url, {'start': 0, 'count': 20}) != RiotAPI._cache_key(url, {'start': 20, 'count': 20})
+    assert RiotAPI._cache_key(url, {'start': 0, 'count': 20}) != RiotAPI._cache_key(url)
+    assert RiotAPI._cache_key(url, {'start': 0, 'count': 20}) == RiotAPI._cache_key(url, {'count': 20, 'start': 0})
+
+
+def test_failed_request_is_not_cached(cached_api):
+    with mock.patch.object(cached_api.session, 'get', return_value=make_response(404, body=b'')):
+        with pytest.raises(RiotAPIError):
+            cached_api.get_match('NA1_404')
+
+    assert len(cached_api.cache) == 0
+
+
+def test_connection_check_is_not_answered_from_cache(cached_api):
+    # A working key fills the cache directory...
+    with mock.patch.object(cached_api.session, 'get', return_value=make_response(200, {'puuid': 'p'})):
+        assert cached_api.test_connection()
+
+    # ...but a revoked key sharing it must still be reported as failing
+    revoked = RiotAPI(api_key='RGAPI-revoked', region='na1', rate_limit=False, cache_dir=cached_api.cache.directory)
+    with mock.patch.object(revoked.session, 'get', return_value=make_response(403, body=b'Forbidden')) as get:
+        assert not revoked.test_connection()
+    assert get.call_count == 1
+    revoked.close()
+
+
+# ==================== STATUS HANDLING ====================
+
+@pytest.fixture
+def api():
+    api = RiotAPI(api_key='RGAPI-test', region='na1', rate_limit=False)
+    yield api
+    api.close()
+
+
+def test_ok_returns_decoded_payload(api):
+    with mock.patch.object(api.session, 'get', return_value=make_response(200, {'id': 1})):
+        assert api._make_request('https://example.test/ok') == {'id': 1}
+
+
+@pytest.mark.parametrize('status, message', [
+    (403, 'Invalid API key or forbidden access'),
+    (404, 'Resource not found: https://example.test/x'),
+    (418, 'Unexpected status code 418'),
+])
+def test_error_statuses_raise_without_retry(api, status, message):
+    with mock.patch.object(api.session, 'get', return_value=make_response(status, body=b'nope')) as get:
+        with pytest.raises(RiotAPIError, match=message):
+            api._make_request('https://example.test/x')
+    assert get.call_count == 1
+
+
+@pytest.mark.parametrize('first, delay', [
+    (make_response(429, body=b'', headers={'Retry-After': '3'}), 3),
+    (make_response(503, body=b''), 1),
+])
+def test_retryable_statuses_back_off_then_succeed(api, first, delay):
+    responses = [first, make_response(200, {'id': 1})]
+    with mock.patch.object(api.session, 'get', side_effect=responses) as get, \
+            mock.patch('src.data_collection.riot_api.time.sleep') as sleep:
+        assert api._make_request('https://example.test/x') == {'id': 1}
+    assert get.call_count == 2
+    sleep.assert_called_once_with(delay)
+
+
+def test_server_errors_give_up_after_max_retries(api):
+    with mock.patch.object(api.session, 'get', return_value=make_response(500, body=b'')) as get, \
+            mock.patch('src.data_collection.riot_api.time.sleep'):
+        with pytest.raises(RiotAPIError, match='Failed after 3 attempts'):
+            api._make_request('https://example.test/x')
+    assert get.call_count == 3
+
+
+# ==================== MEMOIZATION ====================
+
+def test_concurrent_duplicate_puuids_share_one_request(api):
+    def slow_get(url, params=None, timeout=None):
+        time.sleep(0.05)
+        return make_response(200, {'puuid': url.rsplit('/', 1)[-1]})
+
+    with mock.patch.object(api.session, 'get', side_effect=slow_get) as get:
+        summoners = api.get_summoners_by_puuids(['a', 'a', 'b', 'a'])
+
+    assert get.call_count == 2
+    assert [s['puuid'] for s in summoners] == ['a', 'a', 'b', 'a']
+
+
+def test_failed_lookup_is_not_memoized(api):
+    responses = [make_response(404, body=b''), make_response(200, {'puuid': 'a'})]
+    with mock.patch.object(api.session, 'get', side_effect=responses):
+        with pytest.raises(RiotAPIError):
+            api.get_summoner_by_puuid('a')
+        assert api.get_summoner_by_puuid('a') == {'puuid': 'a'}